@@ -26,7 +26,6 @@ from micropython import const
 from adafruit_bus_device.i2c_device import I2CDevice
 from adafruit_register.i2c_bits import RWBits
 from adafruit_register.i2c_bit import RWBit
-from adafruit_register.i2c_struct import UnaryStruct, ROUnaryStruct
 
 try:
     from typing import Tuple
@@ -41,20 +40,19 @@ _WHO_AM_I = (const(0xB5), const(0xFD))  # IAM20380, IAM20380HT
 
 _IAM20380_TEMP_OFFS = const(0x0)
 
+_IAM20380_RESET_TIMEOUT_NS = const(25_000_000)  # soft reset completion
+
 _IAM20380_SMPLRT_DIV_REG = const(0x19)
 _IAM20380_CONFIG_REG = const(0x1A)
 _IAM20380_GYRO_CONFIG_REG = const(0x1B)
 _IAM20380_LP_MODE_CFG_REG = const(0x1E)
+_IAM20380_INT_ENABLE_REG = const(0x38)
+_IAM20380_INT_STATUS_REG = const(0x3A)
 _IAM20380_TEMP_OUT_H_REG = const(0x41)
 _IAM20380_GYRO_XOUT_H_REG = const(0x43)
 _IAM20380_PWR_MGMT_1_REG = const(0x6B)
 _IAM20380_WHO_AM_I_REG = const(0x75)
 
-_IAM20380_SENS_250DPS = 313
-_IAM20380_SENS_500DPS = 65.5
-_IAM20380_SENS_1000DPS = 32.8
-_IAM20380_SENS_2000DPS = 16.4
-
 _IAM20380_RANGE_250DPS = const(0x0)
 _IAM20380_RANGE_500DPS = const(0x1)
 _IAM20380_RANGE_1000DPS = const(0x2)
@@ -69,29 +67,98 @@ _IAM20380_AVG_32 = const(0x5)
 _IAM20380_AVG_64 = const(0x6)
 _IAM20380_AVG_128 = const(0x7)
 
+_IAM20380_FS = (250, 500, 1000, 2000)  # dps, indexed by FS_SEL
+_IAM20380_SENS = (131, 65.5, 32.8, 16.4)  # LSB/dps, indexed by FS_SEL
+_IAM20380_AVGS = (1, 2, 4, 8, 16, 32, 64, 128)  # indexed by G_AVGCFG
+
+# O(1) setter validation, the codes are log2 of the value (FS in 250 dps units)
+_IAM20380_FS_VALID = {250, 500, 1000, 2000}
+_IAM20380_AVGS_VALID = {1, 2, 4, 8, 16, 32, 64, 128}
+
+# full register images for the library default configuration
+_IAM20380_PWR_MGMT_1_RESET = const(0x80)  # DEVICE_RESET
+_IAM20380_GYRO_CONFIG_DEFAULT = const(_IAM20380_RANGE_250DPS << 3)  # FCHOICE_B 0
+_IAM20380_LP_MODE_CFG_DEFAULT = const(0x80 | _IAM20380_AVG_8 << 4)  # GYRO_CYCLE
+_IAM20380_SMPLRT_DIV_DEFAULT = const(255)
+
+_IAM20380_DATA_RDY_INT_EN = const(0x01)  # INT_ENABLE, needed for INT_STATUS
+_IAM20380_DATA_RDY_INT = const(0x01)  # INT_STATUS, cleared when read
+_IAM20380_DATA_RDY_MARGIN_NS = const(10_000_000)  # on top of two ODR periods
+
+# host-side cache contents for the library default configuration, known
+# without reading anything back from the sensor
+_IAM20380_ODR_DEFAULT = 1000 / (1 + _IAM20380_SMPLRT_DIV_DEFAULT)
+_IAM20380_AVGS_DEFAULT = _IAM20380_AVGS[_IAM20380_AVG_8]
+_IAM20380_DLPF_DEFAULT = const(0)  # CONFIG is left at its reset value
+
+
+# The sample conversion is a plain module function so the hot paths avoid a
+# method lookup. @micropython.native is intentionally not applied: it is a
+# compiler directive, so it cannot be guarded with try/except, and
+# CircuitPython builds without the native emitter refuse to import it.
+def _convert(
+    buf: memoryview, offset: int, inv_sens: float
+) -> Tuple[float, float, float]:
+    """Unpack the big-endian signed 16 bit gyroscope outputs at ``offset``
+    in ``buf`` and scale them to dps"""
+    x, y, z = unpack_from(">hhh", buf, offset)
+    return (x * inv_sens, y * inv_sens, z * inv_sens)
+
+
+def _scale_temperature(temp: int) -> float:
+    """Scale the signed 16 bit TEMP_OUT value to degrees C"""
+    temp -= _IAM20380_TEMP_OFFS
+    temp /= 326.8
+    temp += 25  # not sure this is correct, in reference to datasheet p36
+    return temp
 
-class IAM20380:
-    """Driver for the IAM20380 3-axis gyroscope."""
 
-    _chip_id = ROUnaryStruct(_IAM20380_WHO_AM_I_REG, "<B")
-    _rst_bit = RWBit(_IAM20380_PWR_MGMT_1_REG, 7)
+class IAM20380:  # pylint: disable=too-many-instance-attributes  # config cache
+    """Driver for the IAM20380 3-axis gyroscope.
+
+    The configuration properties are cached on the host as they are set,
+    writing the registers directly bypasses them and leaves the cache stale.
+    """
+
     _fs_sel = RWBits(2, _IAM20380_GYRO_CONFIG_REG, 3)
-    _pwr_mgmt_1 = UnaryStruct(_IAM20380_PWR_MGMT_1_REG, "<B")
     _gavg_cfg = RWBits(3, _IAM20380_LP_MODE_CFG_REG, 4)
-    _fchoice_b = RWBits(2, _IAM20380_GYRO_CONFIG_REG, 0)
     _dlpf_cfg = RWBits(3, _IAM20380_CONFIG_REG, 0)
-    _smplrt_div = UnaryStruct(_IAM20380_SMPLRT_DIV_REG, "<B")
-    _gyro_cycle = RWBit(_IAM20380_LP_MODE_CFG_REG, 7)
     _sleep = RWBit(_IAM20380_PWR_MGMT_1_REG, 6)
 
     def __init__(self, i2c_bus: I2C, addr: int = _DEFAULT_ADDR) -> None:
         self.i2c_device = I2CDevice(i2c_bus, addr)
+        # register address and value for single register access
+        self._reg_buf = bytearray(2)
+        # TEMP_OUT_H/L followed by GYRO_XOUT_H through GYRO_ZOUT_L
+        self._buffer = bytearray(8)
+        self._mv = memoryview(self._buffer)  # decoded in place, never sliced
+        # host-side configuration cache, set to the defaults by reset()
+        self._fs_val = 0
+        self._sens = 0.0
+        self._inv_sens = 0.0
+        self._smplrt_div_cached = 0
+        self._odr_cached = 0.0
+        self._avgs_val = 0
+        self._dlpf_val = 0
         self.reset()  # a soft reset is required
-        if self._chip_id not in _WHO_AM_I:  # ensured after soft reset
+        cid = self._read_reg(_IAM20380_WHO_AM_I_REG)
+        if cid not in _WHO_AM_I:  # ensured after soft reset
+            expected = ", ".join(f"{i:#x}" for i in _WHO_AM_I)
             raise RuntimeError(
-                f"IAM20380 @ {addr}: bad chip id '{self._chip_id}' != '{_WHO_AM_I}'"
+                f"IAM20380 @ {addr:#x}: bad chip id '{cid:#x}' not in ({expected})"
             )
-        self._buffer = bytearray(6)
+
+    def _read_reg(self, reg: int) -> int:
+        self._reg_buf[0] = reg
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(self._reg_buf, self._reg_buf, out_end=1, in_start=1)
+        return self._reg_buf[1]
+
+    def _write_reg(self, reg: int, val: int) -> None:
+        self._reg_buf[0] = reg
+        self._reg_buf[1] = val
+        with self.i2c_device as i2c:
+            i2c.write(self._reg_buf)
 
     def reset(self) -> None:
         """Reset the sensor to the default state set by the library
@@ -104,74 +171,198 @@ class IAM20380:
             Noise based on 0.008dps/sqrt(hz): 0.09 dps rms
             Current consumption: 1.3mA
         """
-        self._rst_bit = True
-        self._range = _IAM20380_RANGE_250DPS
-        self._smplrt_div = 255
-        self._fchoice_b = 0
-        self._gavg_cfg = 3
-        self._gyro_cycle = True
+        # whole-register writes, the bitfield descriptors would each do
+        # a read-modify-write of a register shared with other fields
+        self._write_reg(_IAM20380_PWR_MGMT_1_REG, _IAM20380_PWR_MGMT_1_RESET)
+        self._wait_for_reset()
+        self._write_reg(_IAM20380_GYRO_CONFIG_REG, _IAM20380_GYRO_CONFIG_DEFAULT)
+        self._write_reg(_IAM20380_SMPLRT_DIV_REG, _IAM20380_SMPLRT_DIV_DEFAULT)
+        self._write_reg(_IAM20380_LP_MODE_CFG_REG, _IAM20380_LP_MODE_CFG_DEFAULT)
+        self._set_range(_IAM20380_RANGE_250DPS)
+        self._smplrt_div_cached = _IAM20380_SMPLRT_DIV_DEFAULT
+        self._odr_cached = _IAM20380_ODR_DEFAULT
+        self._avgs_val = _IAM20380_AVGS_DEFAULT
+        self._dlpf_val = _IAM20380_DLPF_DEFAULT
+
+    def _wait_for_reset(self) -> None:
+        # DEVICE_RESET clears itself once the reset completes, poll it rather
+        # than sleeping for the worst case
+        deadline = time.monotonic_ns() + _IAM20380_RESET_TIMEOUT_NS
+        while True:
+            try:
+                pwr_mgmt_1 = self._read_reg(_IAM20380_PWR_MGMT_1_REG)
+            except OSError:
+                pwr_mgmt_1 = _IAM20380_PWR_MGMT_1_RESET  # may NACK while resetting
+            if not pwr_mgmt_1 & _IAM20380_PWR_MGMT_1_RESET:
+                return
+            if time.monotonic_ns() > deadline:
+                raise RuntimeError("IAM20380: soft reset did not complete")
+            time.sleep(0.001)
+
+    def _set_range(self, sel: int) -> None:
+        # cache the FS_SEL derived values so samples need no register reads
+        self._fs_val = _IAM20380_FS[sel]
+        self._sens = _IAM20380_SENS[sel]
+        self._inv_sens = 1 / self._sens
+
+    def _read_burst(self, reg: int, start: int, end: int) -> None:
+        """Read the registers starting at ``reg`` into ``_buffer[start:end]``
+        in a single transaction, the register pointer auto-increments"""
+        self._buffer[0] = reg
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(
+                self._buffer, self._buffer, out_end=1, in_start=start, in_end=end
+            )
+
+    def read_all(self) -> Tuple[float, Tuple[float, float, float]]:
+        """Read the temperature and gyroscope outputs in one I2C transaction.
+        Returns a 2-tuple of the temperature as float and the X, Y, Z
+        rotation 3-tuple in dps.
+        """
+        self._read_burst(_IAM20380_TEMP_OUT_H_REG, 0, 8)
+        temp = unpack_from(">h", self._mv, 0)[0]
+        return (
+            _scale_temperature(temp),
+            _convert(self._mv, 2, self._inv_sens),
+        )
 
     @property
     def temperature(self) -> float:
         """The processed temperature sensor value, returned as float"""
-        self._buffer[0] = _IAM20380_TEMP_OUT_H_REG
-        with self.i2c_device as i2c:
-            i2c.write_then_readinto(self._buffer, self._buffer, out_end=1)
-        temp = self._buffer[0] << 8 | self._buffer[1]
-        temp -= _IAM20380_TEMP_OFFS
-        temp /= 326.8
-        temp += 25  # not sure this is correct, in reference to datasheet p36
-        return temp
+        self._read_burst(_IAM20380_TEMP_OUT_H_REG, 0, 2)
+        return _scale_temperature(unpack_from(">h", self._mv, 0)[0])
 
     @property
     def rotation(self) -> Tuple[float, float, float]:
         """The processed gyroscope sensor values.
         A 3-tuple of X, Y, Z axis values in dps that are signed floats.
         """
-        raw = self.raw
-
-        # signed 16 to python int
-        x = raw[0]
-        if (x & 0x8000) == 0x8000:
-            x -= 0xFFFF
-
-        y = raw[1]
-        if (y & 0x8000) == 0x8000:
-            y -= 0xFFFF
+        self._read_burst(_IAM20380_GYRO_XOUT_H_REG, 2, 8)
+        return _convert(self._mv, 2, self._inv_sens)
 
-        z = raw[2]
-        if (z & 0x8000) == 0x8000:
-            z -= 0xFFFF
-
-        # scale to g by LSB in datasheet
-        sens = self.sensitivity
-        x /= sens
-        y /= sens
-        z /= sens
-        return (x, y, z)
+    def into(self, out) -> None:
+        """Read the gyroscope into ``out`` in place, as X, Y, Z in dps.
+        ``out`` is a preallocated sequence of 3 floats, such as
+        ``array.array("f", (0, 0, 0))``, reused across calls in a tight loop.
+        """
+        self._read_burst(_IAM20380_GYRO_XOUT_H_REG, 2, 8)
+        x, y, z = unpack_from(">hhh", self._mv, 2)
+        inv_sens = self._inv_sens
+        out[0] = x * inv_sens
+        out[1] = y * inv_sens
+        out[2] = z * inv_sens
+
+    def readinto(self, buf: bytearray) -> None:
+        """Read the big-endian GYRO_XOUT_H through GYRO_ZOUT_L registers
+        unconverted into the first 6 bytes of ``buf``
+        """
+        self._reg_buf[0] = _IAM20380_GYRO_XOUT_H_REG
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(self._reg_buf, buf, out_end=1, in_end=6)
+
+    def read_samples(self, n: int, out_x, out_y, out_z) -> None:
+        """Read ``n`` consecutive gyroscope samples, the signed X, Y, Z
+        outputs of sample ``i`` written to ``out_x[i]``, ``out_y[i]`` and
+        ``out_z[i]``. Each is preallocated, such as ``array.array("h", [0] * n)``,
+        keeping every axis contiguous.
+
+        Each read waits for data ready, so the batch is a time series at the
+        ODR and takes ``n / odr`` seconds. The data ready interrupt, which also
+        drives the INT pin, is enabled only for the duration of the batch.
+        Raises RuntimeError if no new sample arrives within two ODR periods.
+        """
+        period_ns = int(1_000_000_000 / self._odr_cached)
+        poll_interval = 0.125 / self._odr_cached  # s, an eighth of a period
+        timeout_ns = 2 * period_ns + _IAM20380_DATA_RDY_MARGIN_NS
+        view = self._mv
+        int_enable = self._read_reg(_IAM20380_INT_ENABLE_REG)
+        self._write_reg(
+            _IAM20380_INT_ENABLE_REG, int_enable | _IAM20380_DATA_RDY_INT_EN
+        )
+        try:
+            self._read_reg(_IAM20380_INT_STATUS_REG)  # drop a stale data ready
+            for i in range(n):
+                deadline = time.monotonic_ns() + timeout_ns
+                # reading INT_STATUS clears DATA_RDY_INT for the next sample
+                while not (
+                    self._read_reg(_IAM20380_INT_STATUS_REG) & _IAM20380_DATA_RDY_INT
+                ):
+                    if time.monotonic_ns() > deadline:
+                        raise RuntimeError("IAM20380: gyroscope data not ready")
+                    time.sleep(poll_interval)
+                self._read_burst(_IAM20380_GYRO_XOUT_H_REG, 2, 8)
+                out_x[i], out_y[i], out_z[i] = unpack_from(">hhh", view, 2)
+        finally:
+            self._write_reg(_IAM20380_INT_ENABLE_REG, int_enable)
 
     @property
     def raw(self) -> Tuple[int, int, int]:
-        self._buffer[0] = _IAM20380_GYRO_XOUT_H_REG
-        with self.i2c_device as i2c:
-            i2c.write_then_readinto(self._buffer, self._buffer, out_end=1)
-        x = self._buffer[0] << 8 | self._buffer[1]
-        y = self._buffer[2] << 8 | self._buffer[3]
-        z = self._buffer[4] << 8 | self._buffer[5]
-        return (x, y, z)
+        """The signed 16 bit X, Y, Z gyroscope output registers"""
+        self._read_burst(_IAM20380_GYRO_XOUT_H_REG, 2, 8)
+        return unpack_from(">hhh", self._mv, 2)
 
     @property
     def sensitivity(self) -> float:
         """The gyroscope sensitivity, based upon FS_SEL, returned as floats LSB/dps"""
-        r = self._range
-        if r == _IAM20380_RANGE_250DPS:
-            return _IAM20380_SENS_250DPS
-        elif r == _IAM20380_RANGE_500DPS:
-            return _IAM20380_SENS_500DPS
-        elif r == _IAM20380_RANGE_1000DPS:
-            return _IAM20380_SENS_1000DPS
-        elif r == _IAM20380_RANGE_2000DPS:
-            return _IAM20380_SENS_2000DPS
+        return self._sens
+
+    @property
+    def fs(self) -> int:  # pylint: disable=invalid-name  # datasheet FS name
+        """The gyroscope full scale range in +/- dps: 250, 500, 1000 or 2000"""
+        return self._fs_val
+
+    @fs.setter
+    def fs(self, value: int) -> None:  # pylint: disable=invalid-name
+        if value not in _IAM20380_FS_VALID:
+            raise ValueError("fs must be 250, 500, 1000 or 2000 dps")
+        sel = (int(value) // 250).bit_length() - 1  # the cache stores the int
+        self._fs_sel = sel
+        self._set_range(sel)
+
+    @property
+    def smplrt_div(self) -> int:
+        """The gyroscope sample rate divider"""
+        return self._smplrt_div_cached
+
+    @smplrt_div.setter
+    def smplrt_div(self, value: int) -> None:
+        if not 0 <= value <= 255 or value % 1:
+            raise ValueError("SMPLRT_DIV must be an integer 0-255")
+        value = int(value)  # store integral floats and bools as int
+        self._write_reg(_IAM20380_SMPLRT_DIV_REG, value)
+        self._smplrt_div_cached = value
+        self._odr_cached = 1000 / (1 + value)
+
+    @property
+    def odr(self) -> float:
+        """The low power mode output data rate in Hz, 1 kHz / (1 + SMPLRT_DIV)"""
+        return self._odr_cached
+
+    @property
+    def avgs(self) -> int:
+        """Number of averages the gyro takes per measurement: 1, 2, 4 ... 128"""
+        return self._avgs_val
+
+    @avgs.setter
+    def avgs(self, value: int) -> None:
+        if value not in _IAM20380_AVGS_VALID:
+            raise ValueError("avgs must be a power of 2 from 1 to 128")
+        value = int(value)  # store integral floats and bools as int
+        self._gavg_cfg = value.bit_length() - 1
+        self._avgs_val = value
+
+    @property
+    def dlpf(self) -> int:
+        """The gyroscope digital low pass filter configuration, DLPF_CFG 0-6"""
+        return self._dlpf_val
+
+    @dlpf.setter
+    def dlpf(self, value: int) -> None:
+        if not 0 <= value <= 6 or value % 1:
+            raise ValueError("DLPF must be an integer between 0b000 and 0b110")
+        value = int(value)  # store integral floats and bools as int
+        self._dlpf_cfg = value
+        self._dlpf_val = value
 
     @property
     def sleep(self) -> bool:
@@ -182,52 +373,5 @@ class IAM20380:
         self._sleep = val
 
 
-#    @property
-#    def range(self) -> int:
-#        """The gyroscope full scale output setting"""
-#        return self._fs_sel
-#
-#    @range.setter
-#    def range(self, value: int) -> None:
-#        if not (0 <= value <= 3):
-#            raise ValueError("range must be 0b00 to 0b11.")
-#        self._fs_sel = value
-#
-#
-#
-#    @property
-#    def dlpf(self) -> int:
-#        """The gyroscope dual low pass filter configure bits"""
-#        return self._dlpf_cfg
-#
-#    @dlpf.setter
-#    def dlpf(self, value : int) -> None:
-#        if not (1 <= value <= 6):
-#            raise ValueError("DLPF must be between 0b000 and 0b110")
-#        else:
-#            self._dlpf_cfg = value
-#
-#    @property
-#    def sr_div(self) -> int:
-#        """The gyroscope sample rate divider"""
-#        return self._smplrt_div
-#
-#    @sr_div.setter
-#    def sr_div(self, value : int) -> None:
-#        if not (0 <= value <= 255):
-#            raise ValueError("SMPLRT_DIV must be 0-255")
-#        self._smplrt_div = value
-#
-#    @property
-#    def avg(self) -> int:
-#        "Number of averages the gyro takes per measurement, values 0-7, averages 2^x"
-#        return self._gavg_cfg
-#
-#    @avg.setter
-#    def avg(self, value : int) -> None:
-#        if not (0 <= value <= 7):
-#            raise ValueError("Averages must be 0b000 to 0b111")
-#        self._gavg_cfg = value
-#
 #    def self_test(self):
 #        pass
@@ -0,0 +1,84 @@
+"""
+sierralobo_iam20380_fast.py
+
+    Batch post-processing of IAM20380 gyroscope samples on CPython hosts
+
+* Author(s): chillis
+* Affiliation(s): Sierra Lobo, Inc.
+
+* Repo Link: https://github.com/Sierra-Lobo/SierraLobo_CircuitPython_IAM20380
+
+Implementation Notes:
+
+For Linux hosts such as a Raspberry Pi, not microcontrollers. Requires NumPy,
+the raw record conversion is compiled with Numba when it is installed and
+otherwise falls back to NumPy.
+
+Converted samples are written structure of arrays, to a float32 ``out`` of
+shape (3, n) with the X, Y and Z axes each contiguous in ``out[0]``,
+``out[1]`` and ``out[2]``. ``inv_sens`` is ``1 / sensitivity`` for the full
+scale range the samples were taken at.
+
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _convert_raw_numpy(raw, out, inv_sens):
+    samples = np.frombuffer(raw, dtype=">i2").reshape(-1, 3)
+    np.multiply(samples.T, inv_sens, out=out)
+
+
+if numba is not None:
+
+    # cache=True keeps the compiled kernel on disk, avoiding the cold
+    # compile on every interpreter start
+    @numba.njit(cache=True, fastmath=True)
+    def _convert_raw_numba(raw, out, inv_sens):
+        for i in range(out.shape[1]):
+            for axis in range(3):
+                k = 6 * i + 2 * axis
+                val = (np.int32(raw[k]) << 8) | raw[k + 1]
+                if val & 0x8000:
+                    val -= 0x10000
+                out[axis, i] = val * inv_sens
+
+    _convert_raw = _convert_raw_numba
+
+else:
+    _convert_raw = _convert_raw_numpy
+
+
+def _check_out(out: np.ndarray, n: int) -> None:
+    # checked here as the Numba kernel does no bounds checking
+    if out.dtype != np.float32 or out.shape != (3, n):
+        raise ValueError(f"out must be a float32 array of shape (3, {n})")
+
+
+def convert_raw(buf, out: np.ndarray, inv_sens: float) -> None:
+    """Convert the 6 byte big-endian X, Y, Z records written by
+    ``IAM20380.readinto``, concatenated in ``buf``, to dps in ``out``
+    """
+    raw = np.frombuffer(buf, dtype=np.uint8)
+    if raw.size % 6:
+        raise ValueError("buf must hold whole 6 byte samples")
+    _check_out(out, raw.size // 6)
+    _convert_raw(raw, out, np.float32(inv_sens))
+
+
+def scale_samples(raw_x, raw_y, raw_z, out: np.ndarray, inv_sens: float) -> None:
+    """Scale the signed 16 bit per-axis arrays filled by
+    ``IAM20380.read_samples`` to dps in ``out``
+    """
+    n = len(raw_x)
+    if len(raw_y) != n or len(raw_z) != n:
+        raise ValueError("raw_x, raw_y and raw_z must be the same length")
+    _check_out(out, n)
+    inv_sens = np.float32(inv_sens)
+    for axis, raw in enumerate((raw_x, raw_y, raw_z)):
+        np.multiply(np.asarray(raw), inv_sens, out=out[axis])
@@ -0,0 +1,199 @@
+# register constants are shared with the driver, and FakeI2C mirrors the
+# busio.I2C signatures without needing every argument
+# pylint: disable=protected-access,unused-argument,too-many-arguments,no-self-use
+import array
+import struct
+
+import pytest
+
+import sierralobo_iam20380 as iam
+
+
+class FakeI2C:
+    """IAM20380 register file behind the busio.I2C interface, the register
+    pointer auto-increments across a burst like the sensor"""
+
+    def __init__(self):
+        self.regs = bytearray(256)
+        self.regs[iam._IAM20380_WHO_AM_I_REG] = 0xB5
+        self.writes = []
+        # PWR_MGMT_1 reads that still see DEVICE_RESET, None never clears it
+        self.reset_polls = 1
+        # how many of those reads are not acknowledged
+        self.reset_nacks = 0
+        # with data ready enabled, every nth INT_STATUS read reports a new
+        # sample from samples, 0 never does
+        self.ready_every = 1
+        self.samples = []
+        self._status_reads = 0
+
+    def try_lock(self):
+        return True
+
+    def unlock(self):
+        pass
+
+    def writeto(self, address, buf, *, start=0, end=None):
+        data = bytes(buf[start:end])
+        if not data:  # I2CDevice probe
+            return
+        for offset, val in enumerate(data[1:]):
+            self.regs[data[0] + offset] = val
+            self.writes.append((data[0] + offset, val))
+
+    def writeto_then_readfrom(
+        self,
+        address,
+        out_buf,
+        in_buf,
+        *,
+        out_start=0,
+        out_end=None,
+        in_start=0,
+        in_end=None
+    ):
+        reg = out_buf[out_start]
+        if reg == iam._IAM20380_PWR_MGMT_1_REG:
+            self._poll_reset()
+        elif reg == iam._IAM20380_INT_STATUS_REG:
+            self._poll_status()
+        in_end = len(in_buf) if in_end is None else in_end
+        for offset in range(in_end - in_start):
+            in_buf[in_start + offset] = self.regs[reg + offset]
+
+    def _poll_status(self):
+        self._status_reads += 1
+        ready = (
+            self.regs[iam._IAM20380_INT_ENABLE_REG] & 0x01
+            and self.ready_every
+            and self._status_reads % self.ready_every == 0
+        )
+        if ready and self.samples:
+            start = iam._IAM20380_GYRO_XOUT_H_REG
+            self.regs[start : start + 6] = struct.pack(">hhh", *self.samples.pop(0))
+        self.regs[iam._IAM20380_INT_STATUS_REG] = 0x01 if ready else 0x00
+
+    def _poll_reset(self):
+        if not self.regs[iam._IAM20380_PWR_MGMT_1_REG] & 0x80:
+            return
+        if self.reset_polls is None:
+            return
+        if self.reset_polls == 0:
+            self.regs[iam._IAM20380_PWR_MGMT_1_REG] = 0x41  # SLEEP, CLKSEL
+            return
+        self.reset_polls -= 1
+        if self.reset_nacks:
+            self.reset_nacks -= 1
+            raise OSError(19)
+
+
+@pytest.fixture(name="bus")
+def fixture_bus():
+    return FakeI2C()
+
+
+def test_reset_registers(bus):
+    iam.IAM20380(bus)
+    assert bus.writes[0] == (iam._IAM20380_PWR_MGMT_1_REG, 0x80)
+    assert bus.regs[iam._IAM20380_GYRO_CONFIG_REG] == 0x00
+    assert bus.regs[iam._IAM20380_SMPLRT_DIV_REG] == 0xFF
+    assert bus.regs[iam._IAM20380_LP_MODE_CFG_REG] == 0xB0
+    # data ready, which drives the INT pin, is only enabled by read_samples
+    assert bus.regs[iam._IAM20380_INT_ENABLE_REG] == 0x00
+
+
+def test_reset_waits_through_nack(bus):
+    bus.reset_polls = 3
+    bus.reset_nacks = 2
+    iam.IAM20380(bus)
+    assert bus.reset_polls == 0
+    assert not bus.regs[iam._IAM20380_PWR_MGMT_1_REG] & 0x80
+
+
+def test_reset_timeout(bus):
+    bus.reset_polls = None
+    with pytest.raises(RuntimeError, match="soft reset"):
+        iam.IAM20380(bus)
+
+
+def test_bad_chip_id(bus):
+    bus.regs[iam._IAM20380_WHO_AM_I_REG] = 0x12
+    with pytest.raises(RuntimeError, match="0x12"):
+        iam.IAM20380(bus)
+
+
+@pytest.mark.parametrize(
+    "name, value, cached, reg, reg_val",
+    [
+        ("fs", 500, 500, iam._IAM20380_GYRO_CONFIG_REG, 0x08),
+        ("fs", 2000.0, 2000, iam._IAM20380_GYRO_CONFIG_REG, 0x18),
+        ("avgs", 128, 128, iam._IAM20380_LP_MODE_CFG_REG, 0xF0),
+        ("avgs", 8.0, 8, iam._IAM20380_LP_MODE_CFG_REG, 0xB0),
+        ("avgs", True, 1, iam._IAM20380_LP_MODE_CFG_REG, 0x80),
+        ("smplrt_div", 9, 9, iam._IAM20380_SMPLRT_DIV_REG, 9),
+        ("smplrt_div", 2.0, 2, iam._IAM20380_SMPLRT_DIV_REG, 2),
+        ("dlpf", 3, 3, iam._IAM20380_CONFIG_REG, 3),
+        ("dlpf", 2.0, 2, iam._IAM20380_CONFIG_REG, 2),
+    ],
+)
+def test_setters_cache(bus, name, value, cached, reg, reg_val):
+    sensor = iam.IAM20380(bus)
+    setattr(sensor, name, value)
+    # repr tells 1 from True and 8 from 8.0
+    assert repr(getattr(sensor, name)) == repr(cached)
+    assert bus.regs[reg] == reg_val
+
+
+def test_range_derived_cache(bus):
+    sensor = iam.IAM20380(bus)
+    assert (sensor.fs, sensor.sensitivity, sensor.smplrt_div) == (250, 131, 255)
+    assert sensor.odr == 1000 / 256
+    sensor.fs = 500
+    sensor.smplrt_div = 9
+    assert sensor.sensitivity == 65.5
+    assert sensor.odr == 100
+
+
+@pytest.mark.parametrize(
+    "name, value",
+    [
+        ("fs", 300),
+        ("fs", 500.5),
+        ("avgs", 3),
+        ("avgs", 0),
+        ("smplrt_div", 256),
+        ("smplrt_div", -1),
+        ("smplrt_div", 2.5),
+        ("dlpf", 7),
+        ("dlpf", 2.5),
+    ],
+)
+def test_setters_reject(bus, name, value):
+    sensor = iam.IAM20380(bus)
+    before = getattr(sensor, name)
+    with pytest.raises(ValueError):
+        setattr(sensor, name, value)
+    assert getattr(sensor, name) == before
+
+
+def test_read_samples_data_ready(bus):
+    sensor = iam.IAM20380(bus)
+    sensor.smplrt_div = 0
+    bus.ready_every = 3
+    bus.samples = [(1, -1, 32767), (2, -2, -32768), (3, -3, 0)]
+    expected = list(zip(*bus.samples))
+    out = [array.array("h", [0] * 3) for _ in range(3)]
+    sensor.read_samples(3, *out)
+    assert [list(axis) for axis in out] == [list(axis) for axis in expected]
+    assert (iam._IAM20380_INT_ENABLE_REG, 0x01) in bus.writes
+    assert bus.regs[iam._IAM20380_INT_ENABLE_REG] == 0x00
+
+
+def test_read_samples_timeout(bus):
+    sensor = iam.IAM20380(bus)
+    sensor.smplrt_div = 0
+    bus.ready_every = 0
+    out = [array.array("h", [0]) for _ in range(3)]
+    with pytest.raises(RuntimeError, match="not ready"):
+        sensor.read_samples(1, *out)
+    assert bus.regs[iam._IAM20380_INT_ENABLE_REG] == 0x00
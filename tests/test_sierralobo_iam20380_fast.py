@@ -0,0 +1,73 @@
+# pylint: disable=protected-access  # both conversion paths are tested directly
+import array
+import struct
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import sierralobo_iam20380_fast as fast  # pylint: disable=wrong-import-position
+
+# X, Y, Z records covering zero, sign, both full scale ends and the sign bit edge
+SAMPLES = (
+    (0, 1, -1),
+    (131, -131, 1310),
+    (32767, -32768, -32767),
+    (0x7F00, -0x8000 + 0xFF, -256),
+)
+INV_SENS = 1 / 131
+
+
+def _records():
+    return b"".join(struct.pack(">hhh", *sample) for sample in SAMPLES)
+
+
+def _expected():
+    return (np.array(SAMPLES, dtype=np.int16).T * np.float32(INV_SENS)).astype(
+        np.float32
+    )
+
+
+CONVERTERS = [fast._convert_raw_numpy]
+if hasattr(fast, "_convert_raw_numba"):  # only defined with Numba installed
+    CONVERTERS.append(fast._convert_raw_numba)
+
+
+@pytest.mark.parametrize("convert", CONVERTERS, ids=lambda f: f.__name__)
+def test_convert_raw_paths(convert, monkeypatch):
+    monkeypatch.setattr(fast, "_convert_raw", convert)
+    out = np.zeros((3, len(SAMPLES)), dtype=np.float32)
+    fast.convert_raw(bytearray(_records()), out, INV_SENS)
+    np.testing.assert_allclose(out, _expected(), rtol=1e-6)
+
+
+def test_rejects_partial_record():
+    out = np.zeros((3, len(SAMPLES)), dtype=np.float32)
+    with pytest.raises(ValueError):
+        fast.convert_raw(_records()[:-1], out, INV_SENS)
+
+
+@pytest.mark.parametrize(
+    "shape, dtype",
+    [
+        ((3, len(SAMPLES) - 1), np.float32),
+        ((len(SAMPLES), 3), np.float32),
+        ((3, len(SAMPLES)), np.float64),
+    ],
+)
+def test_rejects_bad_out(shape, dtype):
+    with pytest.raises(ValueError):
+        fast.convert_raw(_records(), np.zeros(shape, dtype=dtype), INV_SENS)
+
+
+def test_scale_samples():
+    raw = [array.array("h", axis) for axis in zip(*SAMPLES)]
+    out = np.zeros((3, len(SAMPLES)), dtype=np.float32)
+    fast.scale_samples(*raw, out, INV_SENS)
+    np.testing.assert_allclose(out, _expected(), rtol=1e-6)
+
+
+def test_rejects_mismatched_axes():
+    out = np.zeros((3, 2), dtype=np.float32)
+    with pytest.raises(ValueError):
+        fast.scale_samples([0, 0], [0, 0], [0], out, INV_SENS)